@@ -1,4 +1,7 @@
-from pierogi.main import run
+import time
+started_at = time.perf_counter()
+
+from pierogi.main import run  # noqa: E402
 
 if __name__ == '__main__':
-    run()
+    run(started_at=started_at)
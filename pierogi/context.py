@@ -0,0 +1,122 @@
+'''Application context holding lazily initialized bot subsystems'''
+
+import contextlib
+import functools
+import logging
+import os
+import time
+import yaml
+
+# constants
+BASE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'pierogi')
+CONFIG_FILENAME = 'config.yaml'
+DATABASE_FILENAME = 'quotes.db'
+DEBUG_DATABASE_FILENAME = 'quotes_test.db'
+
+
+class StartupTimer:
+    '''
+    Records how long each phase of startup takes
+
+    :attr List[Tuple[str, float]] phases: phase names and their durations in seconds
+    '''
+
+    def __init__(self, started_at=None):
+        '''
+        StartupTimer constructor
+
+        :param float started_at: time.perf_counter() value at which startup began, defaults to now
+        '''
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.phases = []
+
+    def record(self, name, duration):
+        '''Record a phase that was timed elsewhere'''
+        self.phases.append((name, duration))
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        '''Time a named phase of startup'''
+        phase_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - phase_start)
+
+    def report(self):
+        '''Log the duration of every recorded phase and the total startup time'''
+        for name, duration in self.phases:
+            logging.info(f'startup: {name} took {duration * 1000:.1f}ms')
+        logging.info(f'startup: total {(time.perf_counter() - self.started_at) * 1000:.1f}ms')
+
+
+class AppContext:
+    '''
+    Holds the bot's configuration and subsystems, each created on first use
+
+    :attr bool debug: whether the bot is running in debug mode
+    :attr StartupTimer timer: timings of startup phases
+    '''
+
+    def __init__(self, debug=False, timer=None):
+        '''
+        AppContext constructor
+
+        :param bool debug: whether to run in debug mode, using the test database
+        :param StartupTimer timer: timer already tracking startup, defaults to a new one
+        '''
+        self.debug = debug
+        self.timer = StartupTimer() if timer is None else timer
+
+    @functools.cached_property
+    def config(self):
+        '''Contents of the config file, loaded on first access'''
+        with open(os.path.join(BASE_DIR, 'data', CONFIG_FILENAME), 'r') as stream:
+            try:
+                return yaml.safe_load(stream)
+            except yaml.YAMLError as e:
+                logging.error(e)
+                quit()
+
+    @property
+    def bot_username(self) -> str:
+        '''Username of the bot, as given in the config file'''
+        return self.config['BOT_NAME']
+
+    @functools.cached_property
+    def quote_database(self):
+        '''Quote database, constructed on first access'''
+        from pierogi.quote_database import QuoteDatabase
+
+        return QuoteDatabase(DEBUG_DATABASE_FILENAME if self.debug else DATABASE_FILENAME)
+
+
+_context = None
+
+
+def init_context(debug=False, timer=None):
+    '''
+    Create the global application context, replacing any existing one
+
+    :param bool debug: whether to run in debug mode
+    :param StartupTimer timer: timer already tracking startup, defaults to a new one
+    :return: the new application context
+    :rtype: AppContext
+    '''
+    global _context
+    _context = AppContext(debug, timer)
+    return _context
+
+
+def get_context():
+    '''
+    Get the global application context
+
+    :return: the current application context
+    :rtype: AppContext
+    :raises RuntimeError: if init_context hasn't been called, so nothing opens the production
+        database by accident
+    '''
+    if _context is None:
+        raise RuntimeError('application context not initialized, call init_context() first')
+    return _context
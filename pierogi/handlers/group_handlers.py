@@ -3,9 +3,9 @@
 import logging
 import re
 import itertools
-from pierogi.main import quote_database, BOT_USERNAME
-from util.db_classes import QUOTE_TYPES
-from util.util import with_session
+from pierogi.context import get_context
+from pierogi.util.db_classes import QUOTE_TYPES
+from pierogi.util.util import with_session
 from sqlalchemy.orm import Session
 from telegram import Update
 from telegram.ext import ContextTypes, CommandHandler, filters
@@ -73,6 +73,8 @@ async def handle_addquote(
     logging.info('addquote')
     logging.info(session)
 
+    quote_database = get_context().quote_database
+
     message = update.message
     quoted_message = message.reply_to_message
 
@@ -144,7 +146,7 @@ async def handle_addquote(
                 sent_by_id = sent_by.id
                 sent_at = quoted_message.date
 
-            # if sent_by.username == BOT_USERNAME.lstrip('@'):  # prevent quoting bot messages
+            # if sent_by.username == get_context().bot_username.lstrip('@'):  # prevent quoting bot messages
             #     response = f"can't {noun} this bot's messages"
             if sent_by_id == quoted_by_id:  # prevent quoting own messages
                 response = f"can't {noun} your own messages"
@@ -1,39 +1,12 @@
 import logging
-import os
 import sys
+import time
 import traceback
-import yaml
-from pierogi.quote_database import QuoteDatabase
+from pierogi.context import StartupTimer, init_context
 from telegram.ext import ApplicationBuilder, CallbackContext
 from telegram.error import (ChatMigrated, NetworkError, TelegramError)
 from typing import Optional
 
-# check for debug mode
-DEBUG = any(arg in sys.argv[1:] for arg in ['-d', '--debug'])
-
-# logging
-logging.basicConfig(
-    format='%(asctime)s - %(levelname)s - %(name)s - %(message)s',
-    level=logging.INFO
-)
-
-
-# constants
-BASE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'pierogi')
-CONFIG_FILENAME = 'config.yaml'
-DATABASE_FILENAME = 'quotes.db' if not DEBUG else 'quotes_test.db'
-with open(os.path.join(BASE_DIR, 'data', CONFIG_FILENAME), 'r') as stream:
-    try:
-        CONFIG = yaml.safe_load(stream)
-    except yaml.YAMLError as e:
-        logging.error(e)
-        quit()
-BOT_USERNAME: str = CONFIG['BOT_NAME']
-
-# init database
-logging.info('a')
-quote_database = QuoteDatabase(DATABASE_FILENAME)
-
 
 class PierogiCore:
     '''
@@ -73,12 +46,46 @@ class PierogiCore:
         self.app.run_polling()
 
 
-def run():
+def run(argv=None, started_at=None):
     '''
     Core initialization and running
+
+    :param List[str] argv: command line arguments, defaults to sys.argv[1:]
+    :param float started_at: time.perf_counter() value from before pierogi.main was imported, so
+        the startup report includes import time
     '''
-    from pierogi.handlers import handlers
-    logging.info(f'began running. debug mode: {DEBUG}')
+    timer = StartupTimer(started_at)
+    if started_at is not None:
+        timer.record('import modules', time.perf_counter() - started_at)
+
+    with timer.phase('parse arguments and configure logging'):
+        # check for debug mode
+        argv = sys.argv[1:] if argv is None else argv
+        debug = any(arg in argv for arg in ['-d', '--debug'])
+
+        # logging
+        logging.basicConfig(
+            format='%(asctime)s - %(levelname)s - %(name)s - %(message)s',
+            level=logging.INFO
+        )
+
+    context = init_context(debug, timer)
+    logging.info(f'began running. debug mode: {debug}')
+
+    with timer.phase('load config'):
+        config = context.config
+
+    with timer.phase('import handlers'):
+        from pierogi.handlers import handlers
+
+    # open the database before polling so schema problems surface at startup
+    with timer.phase('construct quote database'):
+        quote_database = context.quote_database
+    with timer.phase('open quote database'):
+        quote_database.open()
+
+    with timer.phase('build application'):
+        pierogiCore = PierogiCore(config, handlers)
 
-    pierogiCore = PierogiCore(CONFIG, handlers)
+    timer.report()
     pierogiCore.run()
@@ -1,19 +1,26 @@
 '''Define quote database object and functions for interacting with it'''
 
+import functools
 import logging
 import os
-from pierogi.util.db_classes import Base, Chat, Quote, User
-from sqlalchemy import create_engine
+from pierogi.util.db_classes import SCHEMA_VERSION, Base, Chat, Quote, User
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.sql import exists
 
 
+class SchemaVersionError(RuntimeError):
+    '''Raised when the database schema can't be brought up to the version this build expects'''
+
+
 class QuoteDatabase:
     '''
     Quote database master class
 
-    :attr str filename: database filename location
-    :attr sessionmaker session_factory: SQLAlchemy object for initiating sessions
+    :attr str db_location: database url
+    :attr Engine engine: SQLAlchemy engine, created on first access
+    :attr sessionmaker session_factory: SQLAlchemy object for initiating sessions, created on first access
     '''
     # Status codes for adding quotes
     QUOTE_SUCCESSFULLY_ADDED = 1
@@ -22,19 +29,64 @@ class QuoteDatabase:
 
     def __init__(self, filename='quotes.db'):
         '''
-        Quote database constructor
+        Quote database constructor. No connection is made until the database is first used.
 
-        :param str db_location: file location of the quote database
+        :param str filename: filename of the quote database within the data directory
         '''
         BASE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'pierogi')
 
         self.db_location = f'sqlite:///{os.path.join(BASE_DIR, "data", filename)}'
         logging.info(f'db location: {self.db_location}')
 
+    @functools.cached_property
+    def engine(self) -> Engine:
+        '''Create the database engine and make sure the schema is up to date'''
         engine = create_engine(self.db_location)
-        Base.metadata.create_all(engine)
+        self.ensure_schema(engine)
+        return engine
+
+    @functools.cached_property
+    def session_factory(self) -> sessionmaker:
+        '''Create the session factory bound to the database engine'''
+        return sessionmaker(self.engine)
+
+    def open(self):
+        '''Connect to the database and check its schema, if that hasn't happened yet'''
+        return self.engine
 
-        self.session_factory = sessionmaker(engine)
+    @staticmethod
+    def ensure_schema(engine: Engine):
+        '''
+        Create any missing tables, unless the stored schema version shows they already exist
+
+        The schema version is kept in sqlite's user_version pragma, which lets a matching
+        database skip the table reflection done by create_all. create_all never alters existing
+        tables, so the new version is only stamped once every table's columns match the models.
+
+        :raises SchemaVersionError: if the database was written by a newer schema version, or
+            an existing table doesn't match its model
+        '''
+        with engine.begin() as connection:
+            version = connection.exec_driver_sql('PRAGMA user_version').scalar()
+            if version == SCHEMA_VERSION:
+                return
+            if version > SCHEMA_VERSION:
+                raise SchemaVersionError(
+                    f'db schema version {version} is newer than this build supports ({SCHEMA_VERSION})')
+
+            logging.info(f'creating missing db tables for schema version {SCHEMA_VERSION} (was {version})')
+            Base.metadata.create_all(connection)
+
+            inspector = inspect(connection)
+            for table in Base.metadata.sorted_tables:
+                db_columns = {column['name'] for column in inspector.get_columns(table.name)}
+                model_columns = {column.name for column in table.columns}
+                if db_columns != model_columns:
+                    raise SchemaVersionError(
+                        f'db table {table.name} has columns {sorted(db_columns)}, '
+                        f'expected {sorted(model_columns)}; migrate it by hand')
+
+            connection.exec_driver_sql(f'PRAGMA user_version = {SCHEMA_VERSION}')
 
     def create_session(self, **kwargs):
         '''Create a session for interacting with the database'''
@@ -9,6 +9,10 @@ from sqlalchemy.schema import Table
 
 Base = declarative_base()
 
+# bump whenever the schema below changes. on startup this only creates new tables: databases whose
+# existing tables no longer match the models are refused and must be migrated by hand
+SCHEMA_VERSION = 1
+
 
 # enums
 class CHAT_TYPES(Enum):
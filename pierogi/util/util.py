@@ -3,13 +3,13 @@
 import contextlib
 import functools
 import logging
-from pierogi.main import quote_database
+from pierogi.context import get_context
 
 
 @contextlib.contextmanager
 def session_scope():
     '''Define a session scope for database transactions'''
-    session = quote_database.create_session()
+    session = get_context().quote_database.create_session()
 
     try:
         yield session
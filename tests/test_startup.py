@@ -0,0 +1,107 @@
+'''Tests for lazy startup and the quote database schema version check'''
+
+import importlib
+import sqlite3
+import sys
+import pytest
+import pierogi.context
+from pierogi.context import AppContext, StartupTimer, get_context, init_context
+from pierogi.quote_database import QuoteDatabase, SchemaVersionError
+from pierogi.util.db_classes import SCHEMA_VERSION, Base
+from sqlalchemy import create_engine
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    '''Path to a sqlite file that doesn't exist yet'''
+    return tmp_path / 'quotes.db'
+
+
+def user_version(db_path):
+    '''Read the schema version stamped into a sqlite file'''
+    with sqlite3.connect(db_path) as connection:
+        return connection.execute('PRAGMA user_version').fetchone()[0]
+
+
+def test_fresh_database_is_created_and_stamped(db_path):
+    QuoteDatabase.ensure_schema(create_engine(f'sqlite:///{db_path}'))
+
+    assert user_version(db_path) == SCHEMA_VERSION
+    with sqlite3.connect(db_path) as connection:
+        tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert tables == set(Base.metadata.tables)
+
+
+def test_matching_version_skips_create_all(db_path, monkeypatch):
+    engine = create_engine(f'sqlite:///{db_path}')
+    QuoteDatabase.ensure_schema(engine)
+
+    def fail(*args, **kwargs):
+        raise AssertionError('create_all should not run')
+    monkeypatch.setattr(Base.metadata, 'create_all', fail)
+
+    QuoteDatabase.ensure_schema(engine)
+
+
+def test_newer_version_is_refused_and_not_lowered(db_path):
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION + 1}')
+
+    with pytest.raises(SchemaVersionError):
+        QuoteDatabase.ensure_schema(create_engine(f'sqlite:///{db_path}'))
+    assert user_version(db_path) == SCHEMA_VERSION + 1
+
+
+def test_mismatched_table_is_refused_and_not_stamped(db_path):
+    with sqlite3.connect(db_path) as connection:
+        connection.execute('CREATE TABLE chat (id INTEGER PRIMARY KEY)')
+
+    with pytest.raises(SchemaVersionError):
+        QuoteDatabase.ensure_schema(create_engine(f'sqlite:///{db_path}'))
+    assert user_version(db_path) == 0
+
+
+def test_quote_database_connects_lazily(db_path):
+    quote_database = QuoteDatabase(str(db_path))
+    assert not db_path.exists()
+
+    quote_database.open()
+    assert user_version(db_path) == SCHEMA_VERSION
+
+
+def test_app_context_is_lazy(monkeypatch):
+    context = AppContext(debug=True)
+    assert 'config' not in vars(context)
+    assert 'quote_database' not in vars(context)
+
+    assert context.bot_username == context.config['BOT_NAME']
+    assert context.quote_database.db_location.endswith('quotes_test.db')
+
+
+def test_get_context_requires_init(monkeypatch):
+    monkeypatch.setattr(pierogi.context, '_context', None)
+    with pytest.raises(RuntimeError):
+        get_context()
+
+    context = init_context(debug=True)
+    assert get_context() is context
+
+
+def test_startup_timer_reports_recorded_phases():
+    timer = StartupTimer(started_at=0)
+    timer.record('import modules', 0.5)
+    with timer.phase('load config'):
+        pass
+
+    assert [name for name, _ in timer.phases] == ['import modules', 'load config']
+
+
+def test_importing_main_has_no_side_effects(monkeypatch):
+    pytest.importorskip('telegram')
+    monkeypatch.setattr(pierogi.context, '_context', None)
+    monkeypatch.delitem(sys.modules, 'pierogi.main', raising=False)
+
+    importlib.import_module('pierogi.main')
+
+    assert pierogi.context._context is None
+    assert 'pierogi.handlers' not in sys.modules